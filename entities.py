@@ -1,22 +1,121 @@
-from pydantic import BaseModel, Field
-from typing import Literal, Optional, Union
+import hashlib
+import orjson
+import os
+from collections import deque
+import sys
+import types
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional, Union, get_args, get_origin
+
+# Dispatch tables for export_entities_json: identity/membership checks instead
+# of str(origin) formatting and an if/elif chain per field.
+_UNION_ORIGINS = (Union, types.UnionType)
+_PRIMITIVE_TYPE_NAMES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+
+# Per-class label descriptions, filled once at subclass creation so the text is
+# computed a single time instead of being rebuilt wherever it is needed.
+# Exposed read-only: consumers get the frozen view, only __init_subclass__ writes.
+_label_descriptions: dict[type, str] = {}
+LABEL_DESCRIPTIONS = MappingProxyType(_label_descriptions)
 
 class NamedEntity(BaseModel):
+    # Entities are immutable value objects once extracted; frozen also makes them
+    # hashable, and extra='forbid' lets pydantic-core skip the leftover-keys scan.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     #id: str = Field(..., description="Locally unique id for this entity within the text, used for referencing in relationships.")
     label: str = Field(..., description="")
     def __init_subclass__(cls):
         super().__init_subclass__() # call BaseModel's __init_subclass__
-        cls.model_fields["label"].description = f"Surface form (name) of the {cls.__name__} as it appears in the text."
+        _label_descriptions[cls] = f"Surface form (name) of the {cls.__name__} as it appears in the text."
+        # Pre-normalized docstring (collapsed whitespace, newlines kept) so the
+        # export loop does not redo the string dance on every call.
+        doc = cls.__doc__ or ""
+        cls.__DESC__ = "\n".join(" ".join(line.split()) for line in doc.splitlines()).strip()
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        # Inject the per-class label description only when a JSON schema is
+        # actually generated, instead of mutating FieldInfo per subclass at import.
+        json_schema = handler(core_schema)
+        desc = _label_descriptions.get(cls)
+        if desc is not None:
+            props = handler.resolve_ref_schema(json_schema).get("properties")
+            if props and "label" in props:
+                props["label"]["description"] = desc
+        return json_schema
+
+    @classmethod
+    def fast_construct(cls, **data):
+        """Build an instance without validation, for data whose schema is already
+        guaranteed (e.g. LLM structured output constrained by our own JSON schema)."""
+        return cls.model_construct(**data)
+
+    @classmethod
+    def make(cls, label: str):
+        """Flyweight constructor for label-only entities. Repeated mentions of the
+        same (class, label) pair return the same frozen instance, with the label
+        string interned so downstream dict/set lookups hit the fast path."""
+        return _flyweight(cls, sys.intern(label) if len(label) < 64 else label)
+
+@lru_cache(maxsize=10_000)
+def _flyweight(cls: type, label: str):
+    return cls.model_construct(label=label)
+
+# Allowed values of Literal-typed fields, so trusted paths can do a cheap `in`
+# check instead of running the full pydantic validator.
+@lru_cache(maxsize=None)
+def literal_values(cls: type, field_name: str):
+    field = cls.model_fields.get(field_name)
+    if field is None:
+        return None
+    ann = field.annotation
+    if get_origin(ann) is not Literal:
+        # unwrap Optional[Literal[...]] / Literal[...] | None
+        args = [a for a in get_args(ann) if a is not type(None)]
+        if len(args) != 1 or get_origin(args[0]) is not Literal:
+            return None
+        ann = args[0]
+    return frozenset(v for v in get_args(ann) if v is not None)
 
 # function to retrieve entity list that includes all classes. If multiple inheritance is used, recursively get all subclasses
+# The subclass graph is static after import, so results are memoized; call
+# Entity_Collector.cache_clear() if classes are registered dynamically (e.g. in tests).
+@lru_cache(maxsize=None)
 def Entity_Collector(root = NamedEntity, recursion=False):
     if recursion:
-        subclasses = set(root.__subclasses__())
-        for sub in root.__subclasses__():
-            subclasses.update(Entity_Collector(sub, recursion=True))
-        return list(subclasses)
+        # iterative BFS: one shared set, no per-level recursion frames
+        seen = set()
+        queue = deque(root.__subclasses__())
+        while queue:
+            cls = queue.popleft()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            queue.extend(cls.__subclasses__())
+        return tuple(seen)
+
+    return tuple(NamedEntity.__subclasses__())
+
+# Serialized export cache keyed by a fingerprint of the subclass metadata, so
+# repeated exports skip both the reflection loop and redundant disk writes.
+_export_cache: dict[str, bytes] = {}
 
-    return [cls for cls in NamedEntity.__subclasses__()]
+@lru_cache(maxsize=None)
+def _origin_args(ann):
+    """Memoized typing reflection; annotation objects are interned at class
+    definition, so identity-keyed caching is safe."""
+    origin = get_origin(ann)
+    return origin, (get_args(ann) if origin is not None else ())
+
+def _schema_fingerprint() -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for cls in ALL_ENTITY_CLASSES:
+        h.update(f"{cls.__name__}:{cls.__doc__}:{cls.__annotations__}".encode())
+    return h.hexdigest()
 
 def export_entities_json(filepath: str = "classes.json") -> None:
     """
@@ -26,18 +125,31 @@ def export_entities_json(filepath: str = "classes.json") -> None:
     - Emits 'enum' for Literal[...] (excluding None), and 'nullable' if None is allowed.
     - Maps primitive types (str, int, float, bool) to 'type'.
     """
-    import json
-    from typing import get_origin, get_args, Union
-
+    key = _schema_fingerprint()
+    payload = _export_cache.get(key)
+    if payload is None:
+        payload = _export_cache[key] = _build_export_payload()
+
+    target = Path(filepath)
+    if target.exists() and target.read_bytes() == payload:
+        return
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+def _build_export_payload() -> bytes:
+    """Reflection loop behind export_entities_json; returns the serialized schema."""
     out = {}
 
-    for cls in NamedEntity.__subclasses__():
-        desc = cls.__doc__ or ""
-        # remove any multiple whitespace but keep newlines
-        desc = "\n".join(" ".join(line.split()) for line in desc.splitlines()).strip()
+    for cls in ALL_ENTITY_CLASSES:
+        desc = cls.__DESC__
         attrs = {}
 
-        for fname, field in getattr(cls, "model_fields", {}).items():
+        # Direct attribute access: every cls here is a NamedEntity subclass,
+        # so model_fields is guaranteed by pydantic.
+        for fname, field in cls.model_fields.items():
             if fname == "label":
                 continue
 
@@ -47,36 +159,27 @@ def export_entities_json(filepath: str = "classes.json") -> None:
             type_name = None
 
             # Handle Optional/Union[... , None]
-            origin = get_origin(ann)
-            args = list(get_args(ann)) if origin is not None else []
+            origin, args = _origin_args(ann)
 
             # If Literal directly
-            if str(origin).endswith("Literal"):
+            if origin is Literal:
                 enum_vals = [v for v in args if v is not None]
                 nullable = any(v is None for v in args)
             else:
                 # Unwrap Optional/Union with None (PEP 604 or typing.Union)
-                if origin in (Union, getattr(__import__("types"), "UnionType", Union)):
+                if origin in _UNION_ORIGINS:
                     non_none = [a for a in args if a is not type(None)]
                     nullable = len(non_none) < len(args)
                     ann = non_none[0] if len(non_none) == 1 else ann
-                    origin = get_origin(ann)
-                    args = list(get_args(ann)) if origin is not None else []
+                    origin, args = _origin_args(ann)
 
                 # Literal after unwrapping?
-                if str(origin).endswith("Literal"):
+                if origin is Literal:
                     enum_vals = [v for v in args if v is not None]
                     nullable = nullable or any(v is None for v in args)
                 else:
                     # Primitive mapping
-                    if ann in (str,):
-                        type_name = "string"
-                    elif ann in (int,):
-                        type_name = "integer"
-                    elif ann in (float,):
-                        type_name = "number"
-                    elif ann in (bool,):
-                        type_name = "boolean"
+                    type_name = _PRIMITIVE_TYPE_NAMES.get(ann)
 
             # Build field entry
             if enum_vals is not None:
@@ -89,8 +192,7 @@ def export_entities_json(filepath: str = "classes.json") -> None:
 
         out[cls.__name__] = {"description": desc, "attributes": attrs}
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(out, f, indent=4, ensure_ascii=False)
+    return orjson.dumps(out, option=orjson.OPT_INDENT_2)
 
 class Protein(NamedEntity):
     """
@@ -367,6 +469,11 @@ class HumanDevelopmentalTimepoint(NamedEntity): # is-a LifeStage biolink
     start_value: Optional[float] = Field(None, description="Numeric value (or start if range) on the selected scale (e.g., 20 for GW20, 13 for CS13, 8 for 8 PCW, 3 for DOL3, or start of a range).")
     end_value: Optional[float] = Field(None, description="If range, end value on the same scale (e.g., 22 for GW20–GW22, 10 for PCW8–PCW10).")
 
+# Snapshot of the (static) subclass graph, taken once every class above exists.
+# Also warms the Entity_Collector cache at import.
+ALL_ENTITY_CLASSES = Entity_Collector()
+ALL_ENTITY_CLASSES_RECURSIVE = Entity_Collector(recursion=True)
+
 if __name__ == "__main__":
     print(f"Exported entity schema")
     export_entities_json()
\ No newline at end of file
@@ -1,17 +1,38 @@
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.routers import (
     health, classes, relations, texts, annotations, semantic, enums
 )
+from app.services.embeddings import encode_query, load_embedder
+from app.services.relations import build_relations_meta
+
+def _warm_embedder():
+    # Load the SentenceTransformer and run one encode so the first
+    # /api/semantic/suggest does not pay weight load + kernel warm-up.
+    if load_embedder() is not None:
+        try:
+            encode_query(["warmup"])
+        except Exception:
+            pass
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Annotation Backend")
+    # orjson serializes responses (relations meta, suggest items) several
+    # times faster than stdlib json, and handles numpy scalars natively.
+    app = FastAPI(title="Annotation Backend", default_response_class=ORJSONResponse)
 
-    # CORS (same as before)
+    # CORS: explicit dev-frontend origins (see commands.txt) so Starlette can
+    # precompute the Access-Control-Allow-Origin header instead of mirroring
+    # the request Origin per call (wildcard + credentials is not spec-valid).
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=[
+            "http://127.0.0.1:5173",
+            "http://localhost:5173",
+        ],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -26,6 +47,17 @@ def create_app() -> FastAPI:
     app.include_router(semantic.router, prefix="/api", tags=["semantic"])
     app.include_router(enums.router, prefix="/api", tags=["enums & proposals"])
 
+    @app.on_event("startup")
+    def warm_embedder():
+        # background thread: startup should not block on model download/load
+        threading.Thread(target=_warm_embedder, daemon=True, name="embedder-warmup").start()
+
+    @app.on_event("startup")
+    def warm_relations_meta():
+        # import + spec discovery once at startup; the lru_cache makes every
+        # later build_relations_meta() call a plain accessor
+        threading.Thread(target=build_relations_meta, daemon=True, name="relations-meta-warmup").start()
+
     return app
 
 app = create_app()
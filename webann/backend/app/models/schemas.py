@@ -1,12 +1,20 @@
 from typing import Optional, Dict, Any, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # ---- Entities & Relations ----
 class Span(BaseModel):
+    model_config = ConfigDict(frozen=True)
     start: int = Field(..., ge=0, description="0-based start char offset (inclusive)")
     end: int = Field(..., ge=0, description="0-based end char offset (exclusive)")
 
+    @model_validator(mode="after")
+    def _ordered(self):
+        if self.end < self.start:
+            raise ValueError("span end must be >= start")
+        return self
+
 class Entity(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: str
     class_: str = Field(..., alias="class")
     label: str
@@ -14,6 +22,7 @@ class Entity(BaseModel):
     attributes: Dict[str, Any] = {}
 
 class RelationEdge(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: str
     predicate: str
     subject: str
@@ -21,11 +30,20 @@ class RelationEdge(BaseModel):
     attributes: Dict[str, Any] = {}
 
 class SavePayload(BaseModel):
+    model_config = ConfigDict(frozen=True)
     text_id: str
     text: str
     entities: List[Entity]
     relations: List[RelationEdge] = []
 
+    @model_validator(mode="after")
+    def _spans_within_text(self):
+        n = len(self.text)
+        for e in self.entities:
+            if e.span.end > n:
+                raise ValueError(f"Invalid span for entity {e.id}")
+        return self
+
 # ---- Semantic search ----
 class SuggestIn(BaseModel):
     kind: Literal["class", "relation"] = "class"
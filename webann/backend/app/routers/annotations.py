@@ -1,6 +1,9 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from app.core.paths import ANNOT_FILE
-from app.services.io import read_annotations_jsonl, write_annotations_jsonl
+from app.services.io import annotations_index, annotations_state, append_annotation, write_annotations_jsonl
 from app.services.relations import validate_and_normalize_relations
 from app.models.schemas import SavePayload
 
@@ -8,39 +11,44 @@ router = APIRouter()
 
 @router.get("/annotations/{text_id}/exists")
 async def annotations_exists(text_id: str):
-    items = read_annotations_jsonl(ANNOT_FILE)
-    return {"exists": any(it.get("text_id") == text_id for it in items)}
+    return ORJSONResponse({"exists": text_id in annotations_index(ANNOT_FILE)})
 
 @router.get("/annotations/{text_id}")
 async def get_annotation(text_id: str):
-    items = read_annotations_jsonl(ANNOT_FILE)
-    for it in items:
-        if it.get("text_id") == text_id:
-            return it
-    raise HTTPException(404, "No saved annotation for this text_id")
+    # Single snapshot: index and items must come from the same cache
+    # generation, or a concurrent rewrite could shift the record positions.
+    items, by_id = annotations_state(ANNOT_FILE)
+    idx = by_id.get(text_id)
+    if idx is None:
+        raise HTTPException(404, "No saved annotation for this text_id")
+    # Direct ORJSONResponse: stored records are plain JSON dicts, skip the
+    # jsonable_encoder walk over potentially large annotation payloads.
+    return ORJSONResponse(items[idx])
 
 @router.post("/annotations")
 async def save_annotations(payload: SavePayload, overwrite: bool = Query(False)):
-    for ent in payload.entities:
-        if not (0 <= ent.span.start <= ent.span.end <= len(payload.text)):
-            raise HTTPException(400, f"Invalid span for entity {ent.id}")
-
+    # Span bounds are enforced during model validation (see Span/SavePayload
+    # validators in schemas.py), so the payload arrives here already checked.
     normalized_relations = validate_and_normalize_relations(payload)
 
-    obj = payload.model_dump(by_alias=True)
-    obj.pop("text", None)
+    # Exclude up front instead of dumping and discarding: text can be large and
+    # the raw relations are replaced by their normalized form anyway.
+    obj = payload.model_dump(by_alias=True, exclude={"text", "relations"})
     obj["relations"] = normalized_relations
 
-    items = read_annotations_jsonl(ANNOT_FILE)
-    idx = next((i for i, it in enumerate(items) if it.get("text_id") == payload.text_id), None)
+    items, by_id = annotations_state(ANNOT_FILE)
+    idx = by_id.get(payload.text_id)
 
     if idx is not None and not overwrite:
         raise HTTPException(409, "Annotations for this text_id already exist")
 
-    if idx is not None:
-        items[idx] = obj
+    # Disk writes (append or rewrite + fsync) run in a worker thread so a save
+    # does not stall the event loop for concurrent annotators.
+    if idx is None:
+        # Common case: new text_id, append one line instead of rewriting the file.
+        await asyncio.to_thread(append_annotation, ANNOT_FILE, obj)
     else:
-        items.append(obj)
-
-    write_annotations_jsonl(ANNOT_FILE, items)
-    return {"ok": True, "overwritten": idx is not None}
+        items = list(items)
+        items[idx] = obj
+        await asyncio.to_thread(write_annotations_jsonl, ANNOT_FILE, items)
+    return ORJSONResponse({"ok": True, "overwritten": idx is not None})
@@ -1,15 +1,20 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Response
 from app.core.paths import CLASSES_FILE, PROPOSED_FILE
 from app.models.schemas import ProposedClassIn
-from app.services.io import load_json
+from app.services.io import read_bytes_cached
 from app.services.proposals import propose_class
 
 router = APIRouter()
 
 @router.get("/classes")
 async def get_classes():
-    return load_json(CLASSES_FILE)
+    # classes.json is already valid JSON on disk: serve the cached bytes directly,
+    # skipping the parse + re-serialize cycle per request.
+    return Response(content=read_bytes_cached(CLASSES_FILE), media_type="application/json")
 
 @router.post("/proposed-classes")
 async def post_proposed_class(payload: ProposedClassIn):
-    return propose_class(payload)
+    # reads + appends proposed_classes.py: keep the file I/O off the event loop
+    return await asyncio.to_thread(propose_class, payload)
@@ -1,3 +1,6 @@
+import asyncio
+import re
+
 from fastapi import APIRouter, HTTPException
 from typing import Optional
 from app.core.paths import CLASSES_FILE
@@ -9,18 +12,21 @@ from app.services.enums import append_new_enums
 
 router = APIRouter()
 
+# Compiled once; create_enum runs both per request
+_NON_IDENT_RE = re.compile(r"[^A-Za-z0-9_]+")
+_ENUM_NAME_RE = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+
 @router.get("/enums")
 async def get_enums():
     return list_enums_from_module()
 
 @router.post("/enums")
 async def create_enum(payload: EnumAddIn):
-    import re
     raw = (payload.name or "").strip()
-    name = re.sub(r"[^A-Za-z0-9_]+", "_", raw).upper()
+    name = _NON_IDENT_RE.sub("_", raw).upper()
     if not name.endswith("_ENUM"):
         name = name + "_ENUM"
-    if not re.match(r"^[A-Z_][A-Z0-9_]*$", name):
+    if not _ENUM_NAME_RE.match(name):
         raise HTTPException(400, f"Invalid enum name after normalization: {name}")
 
     values = [str(v).strip() for v in (payload.values or []) if str(v).strip()]
@@ -31,7 +37,8 @@ async def create_enum(payload: EnumAddIn):
     if name in existing:
         raise HTTPException(409, f"Enum '{name}' already exists.")
 
-    created = append_new_enums({name: values})
+    # appends to my_enums.py on disk: run off the event loop
+    created = await asyncio.to_thread(append_new_enums, {name: values})
     if not created:
         raise HTTPException(500, "Failed to append enum to my_enums.py")
     return {"ok": True, "name": name, "values": values}
@@ -44,4 +51,5 @@ async def get_field_descriptions():
 async def post_proposed_relation(payload: ProposedRelationIn):
     classes_meta = load_json(CLASSES_FILE)
     known = set(classes_meta.keys())
-    return propose_relation(payload, known_classes=known)
+    # reads + appends proposed_rel.py / my_enums.py: keep off the event loop
+    return await asyncio.to_thread(propose_relation, payload, known_classes=known)
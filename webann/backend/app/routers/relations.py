@@ -1,19 +1,23 @@
 from fastapi import APIRouter, HTTPException
-import json
+import orjson
 
 from app.core.paths import RELATIONS_FILE
+from app.services.io import read_bytes_cached, write_json_atomic
 from app.services.relations import build_relations_meta
 
 router = APIRouter()
 
 @router.get("/relations")
 async def get_relations():
+    # build_relations_meta is cached (and warmed at startup), so this is a
+    # dict return; the relations.json debug artifact is only rewritten on
+    # an explicit refresh, not on every read.
     meta = build_relations_meta()
     if meta:
-        with RELATIONS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=2, ensure_ascii=False)
         return meta
-    return json.loads(RELATIONS_FILE.read_text(encoding="utf-8"))
+    # Fallback snapshot: mtime-cached bytes + orjson parse, no per-request
+    # file read (same treatment classes.json already gets).
+    return orjson.loads(read_bytes_cached(RELATIONS_FILE))
 
 @router.post("/relations/refresh")
 async def refresh_relations():
@@ -22,6 +26,7 @@ async def refresh_relations():
         meta = build_relations_meta()
         if not meta:
             raise HTTPException(500, "Could not rebuild relations meta; check RELATION_SPECS_IMPORT")
+        write_json_atomic(RELATIONS_FILE, meta)
         return {"ok": True, "count": len(meta)}
     except Exception as e:
         raise HTTPException(500, str(e))
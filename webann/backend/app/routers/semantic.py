@@ -1,7 +1,12 @@
+import asyncio
+import importlib.util
+
+import numpy as np
 from fastapi import APIRouter, HTTPException
-from app.services.embeddings import load_index, load_rel_index, load_embedder, encode_query
+from fastapi.responses import ORJSONResponse
+from app.services.embeddings import load_index, load_rel_index, encode_query_one
 from app.core.config import get_settings
-from app.models.schemas import SuggestIn, SuggestOut, SuggestItem
+from app.models.schemas import SuggestIn
 
 router = APIRouter()
 
@@ -13,39 +18,58 @@ async def semantic_status(kind: str = "class"):
         "ready": bool(ok),
         "size": (len(idx["labels"]) if ok else 0),
         "model": get_settings().EMBED_MODEL_NAME,
-        "has_embedder": load_embedder() is not None
+        # Cheap availability probe: don't pull the whole SentenceTransformer
+        # onto the event loop just to answer a status poll. The model itself
+        # loads lazily on first suggest (or in the startup warm-up thread).
+        "has_embedder": importlib.util.find_spec("sentence_transformers") is not None
     }
 
-@router.post("/semantic/suggest", response_model=SuggestOut)
+# No response_model: the items are server-built and JSON-native, so skip
+# FastAPI's jsonable_encoder walk + SuggestOut re-validation and hand the
+# dict straight to orjson. Input validation (SuggestIn) stays.
+@router.post("/semantic/suggest")
 async def semantic_suggest(payload: SuggestIn):
     idx = load_rel_index() if payload.kind == "relation" else load_index()
     if idx is None:
         raise HTTPException(503, "Semantic index missing. Run the embedding builder first.")
 
-    query = " ".join([payload.query or "", payload.label or ""]).strip()
+    # Single formatted string; this is also the encode_query_one cache key.
+    query = f"{(payload.query or '').strip()} {(payload.label or '').strip()}".strip()
     if not query:
-        return {"ready": True, "total": len(idx["labels"]), "items": []}
+        return ORJSONResponse({"ready": True, "total": len(idx["labels"]), "items": []})
 
-    qvec = encode_query([query])[0]
+    # The transformer forward pass takes tens of ms; run it in a worker
+    # thread so concurrent requests aren't serialized behind it. Cache hits
+    # return almost immediately either way.
+    qvec = await asyncio.to_thread(encode_query_one, query)
     sims = idx["embeddings"] @ qvec
 
-    import numpy as np
-    order = np.argsort(-sims)[: max(1, payload.top_k)]
+    # Prune by threshold first — with typical thresholds most of the index
+    # drops out here — then take top-k over the survivors via argpartition:
+    # O(N) selection plus an O(k log k) sort instead of a full sort.
+    keep = np.flatnonzero(sims >= payload.threshold)
+    if not len(keep):
+        return ORJSONResponse({"ready": True, "total": len(idx["labels"]), "items": []})
+    sub = sims[keep]
+    k = max(1, payload.top_k)
+    if k >= len(sub):
+        order = keep[np.argsort(-sub)]
+    else:
+        part = np.argpartition(-sub, k - 1)[:k]
+        order = keep[part[np.argsort(-sub[part])]]
     items = []
     for i in order:
         s = float(sims[i])
-        if s < payload.threshold:
-            continue
         name = idx["labels"][i]
         meta = (idx["meta"].get(name) or {})
         if payload.kind == "relation":
             subj_ok = True
             obj_ok = True
             if payload.subject_class:
-                subj_ok = payload.subject_class in set(meta.get("subject", []))
+                subj_ok = payload.subject_class in meta.get("subject", ())
             if payload.object_class:
-                obj_ok = payload.object_class in set(meta.get("object", []))
+                obj_ok = payload.object_class in meta.get("object", ())
             if not (subj_ok and obj_ok):
                 continue
-        items.append(SuggestItem(class_name=name, score=s, description=meta.get("description")))
-    return {"ready": True, "total": len(idx["labels"]), "items": items}
+        items.append({"class_name": name, "score": s, "description": meta.get("description")})
+    return ORJSONResponse({"ready": True, "total": len(idx["labels"]), "items": items})
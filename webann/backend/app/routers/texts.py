@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.core.paths import TEXTS_FILE
 from app.services.io import load_json
@@ -7,6 +8,9 @@ router = APIRouter()
 
 TEXTS = load_json(TEXTS_FILE)  # list of {id, text}
 
+# Handlers return ORJSONResponse directly: the payloads are server-built and
+# JSON-native, so there is nothing for jsonable_encoder to convert.
+
 @router.get("/texts/next")
 async def get_next(cursor: Optional[int] = None):
     if cursor is None:
@@ -14,7 +18,7 @@ async def get_next(cursor: Optional[int] = None):
     if cursor < 0 or cursor >= len(TEXTS):
         raise HTTPException(404, "No more texts")
     item = TEXTS[cursor]
-    return {"id": item["id"], "text": item["text"], "cursor": cursor, "total": len(TEXTS)}
+    return ORJSONResponse({"id": item["id"], "text": item["text"], "cursor": cursor, "total": len(TEXTS)})
 
 @router.get("/texts/prev")
 async def get_prev(cursor: int):
@@ -23,4 +27,4 @@ async def get_prev(cursor: int):
     if cursor >= len(TEXTS):
         cursor = len(TEXTS)-1
     item = TEXTS[cursor]
-    return {"id": item["id"], "text": item["text"], "cursor": cursor, "total": len(TEXTS)}
+    return ORJSONResponse({"id": item["id"], "text": item["text"], "cursor": cursor, "total": len(TEXTS)})
@@ -15,14 +15,31 @@ class Index(TypedDict):
     embeddings: np.ndarray
     meta: dict
 
+def _load_npz(path):
+    """Prefer allow_pickle=False (builders now save str-dtype labels);
+    fall back for indices built before that change, which stored labels
+    as an object array. np.load on an .npz is lazy, so force the labels
+    member here — that is where the pickle error actually surfaces."""
+    try:
+        data = np.load(path, allow_pickle=False)
+        data["labels"]
+        return data
+    except ValueError:
+        return np.load(path, allow_pickle=True)
+
 @lru_cache(maxsize=1)
 def load_index() -> Optional[Index]:
     if not EMBED_INDEX_FILE.exists():
         return None
-    data = np.load(EMBED_INDEX_FILE, allow_pickle=True)
+    data = _load_npz(EMBED_INDEX_FILE)
     labels = list(map(str, data["labels"].tolist()))
-    embs = data["embeddings"].astype("float32")
-    embs /= (np.linalg.norm(embs, axis=1, keepdims=True) + 1e-12)
+    # C-contiguous float32 so embeddings @ qvec dispatches straight to the
+    # BLAS sgemv kernel; skip the normalization pass if the builder already
+    # saved unit-norm rows.
+    embs = np.ascontiguousarray(data["embeddings"], dtype=np.float32)
+    norms = np.linalg.norm(embs, axis=1, keepdims=True)
+    if not np.allclose(norms, 1.0, atol=1e-3):
+        embs /= (norms + 1e-12)
     meta = {}
     if EMBED_META_FILE.exists():
         try:
@@ -36,10 +53,12 @@ def load_index() -> Optional[Index]:
 def load_rel_index() -> Optional[Index]:
     if not REL_EMBED_INDEX_FILE.exists():
         return None
-    data = np.load(REL_EMBED_INDEX_FILE, allow_pickle=True)
+    data = _load_npz(REL_EMBED_INDEX_FILE)
     labels = list(map(str, data["labels"].tolist()))
-    embs = data["embeddings"].astype("float32")
-    embs /= (np.linalg.norm(embs, axis=1, keepdims=True) + 1e-12)
+    embs = np.ascontiguousarray(data["embeddings"], dtype=np.float32)
+    norms = np.linalg.norm(embs, axis=1, keepdims=True)
+    if not np.allclose(norms, 1.0, atol=1e-3):
+        embs /= (norms + 1e-12)
     meta = {}
     if REL_EMBED_META_FILE.exists():
         try:
@@ -47,13 +66,24 @@ def load_rel_index() -> Optional[Index]:
             meta = json.loads(REL_EMBED_META_FILE.read_text(encoding="utf-8"))
         except Exception:
             meta = {}
+    # Normalize subject/object lists to frozensets once at load time so the
+    # suggest filter does plain membership tests per candidate.
+    for v in meta.values():
+        if isinstance(v, dict):
+            v["subject"] = frozenset(v.get("subject", []) or [])
+            v["object"] = frozenset(v.get("object", []) or [])
     return {"labels": labels, "embeddings": embs, "meta": meta}
 
 @lru_cache(maxsize=1)
 def load_embedder():
     try:
+        import torch
         from sentence_transformers import SentenceTransformer
-        return SentenceTransformer(get_settings().EMBED_MODEL_NAME)
+        model = SentenceTransformer(get_settings().EMBED_MODEL_NAME)
+        if torch.cuda.is_available():
+            # fp16 halves weight/activation bandwidth; only safe on GPU
+            model = model.half().to("cuda")
+        return model
     except Exception:
         # Keep same behavior
         return None
@@ -63,5 +93,31 @@ def encode_query(texts: List[str]) -> np.ndarray:
     if model is None:
         raise HTTPException(501, "Embedding model not installed on server.")
     texts = [("query: " + t.strip()) if t else "query:" for t in texts]
-    vecs = model.encode(texts, normalize_embeddings=True)
+    import torch
+    with torch.inference_mode():
+        if len(texts) > 1:
+            # Smart batching: encode in length order so each mini-batch only pads
+            # to its own longest text, then restore the caller's order.
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            sorted_vecs = model.encode(
+                [texts[i] for i in order],
+                batch_size=32,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            vecs = np.empty_like(sorted_vecs)
+            vecs[order] = sorted_vecs
+        else:
+            vecs = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
     return vecs.astype("float32")
+
+@lru_cache(maxsize=2048)
+def _encode_one_cached(text: str) -> bytes:
+    # bytes are hashable and compact; decoded on the way out
+    return encode_query([text])[0].tobytes()
+
+def encode_query_one(text: str) -> np.ndarray:
+    """Single-query embedding with an LRU cache: annotators hit suggest with
+    the same query/label over and over, and a cache hit skips the whole
+    transformer forward pass. Returns a read-only (D,) float32 view."""
+    return np.frombuffer(_encode_one_cached(text), dtype=np.float32)
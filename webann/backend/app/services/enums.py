@@ -1,5 +1,5 @@
 from __future__ import annotations
-import importlib, json, re, tempfile, os
+import copy, importlib, json, orjson, re, tempfile, os
 from typing import Dict, List
 from fastapi import HTTPException
 from pathlib import Path
@@ -8,13 +8,22 @@ from app.core.config import get_settings
 from app.core.paths import FIELD_DESC_FILE
 from app.services.io import write_json_atomic
 
+# Parsed view of my_enums.py keyed by the file's mtime: the reload (a full
+# compile + exec of the module) only happens when the file actually changed.
+_enums_cache: tuple | None = None  # (mtime_ns, data)
+
 def list_enums_from_module() -> dict:
     """Return {NAME: [values,...]} from relcode.utils.my_enums."""
+    global _enums_cache
     modname = get_settings().ENUMS_IMPORT
     try:
         mod = importlib.import_module(modname)
+        mod_file = getattr(mod, "__file__", None)
+        mtime = Path(mod_file).stat().st_mtime_ns if mod_file else None
+        if mtime is not None and _enums_cache is not None and _enums_cache[0] == mtime:
+            return _enums_cache[1]
         try:
-            mod = importlib.reload(mod)  # dev convenience
+            mod = importlib.reload(mod)  # picks up appended enums
         except Exception:
             pass
     except Exception as e:
@@ -27,6 +36,8 @@ def list_enums_from_module() -> dict:
             continue
         if isinstance(v, (list, tuple, set)):
             out[k] = [str(x) for x in list(v)]
+    if mtime is not None:
+        _enums_cache = (mtime, out)
     return out
 
 def append_new_enums(new_enums: Dict[str, List[str]]) -> List[str]:
@@ -51,13 +62,22 @@ def append_new_enums(new_enums: Dict[str, List[str]]) -> List[str]:
         f.write("".join(lines))
     return list(new_enums.keys())
 
+# Parsed field_descriptions.json keyed by the file's mtime. Callers mutate
+# the result (upsert below), so hand out a copy of the cached object; the
+# upsert's atomic write bumps the mtime and invalidates naturally.
+_fd_cache: tuple | None = None  # (mtime_ns, data)
+
 def load_field_descriptions() -> dict:
+    global _fd_cache
     if not FIELD_DESC_FILE.exists():
         return {"general_qualifiers": {}}
-    try:
-        return json.loads(FIELD_DESC_FILE.read_text(encoding="utf-8"))
-    except Exception:
-        return {"general_qualifiers": {}}
+    mtime = FIELD_DESC_FILE.stat().st_mtime_ns
+    if _fd_cache is None or _fd_cache[0] != mtime:
+        try:
+            _fd_cache = (mtime, orjson.loads(FIELD_DESC_FILE.read_bytes()))
+        except Exception:
+            return {"general_qualifiers": {}}
+    return copy.deepcopy(_fd_cache[1])
 
 def upsert_relation_specific_field_descriptions(relation_name: str, new_items: dict):
     if not new_items:
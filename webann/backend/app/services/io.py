@@ -2,40 +2,111 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List
 from fastapi import HTTPException
-import json, tempfile, os
+import orjson, tempfile, threading, os
 
 def load_json(path: Path):
     if not path.exists():
         raise HTTPException(500, f"Missing file: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
-def read_annotations_jsonl(path: Path) -> List[Dict[str, Any]]:
+# In-memory view of an annotations JSONL file, invalidated by mtime: the parsed
+# records plus a text_id -> list-index map so lookups are O(1) instead of a
+# full-file scan per request.
+_annot_cache: Dict[Path, tuple] = {}
+
+# Writers run in worker threads (asyncio.to_thread), so the read-modify-prime
+# sequences below must be atomic: without this, two overlapping appends each
+# prime the cache with only their own record under the post-both-writes mtime,
+# permanently hiding the other's record from exists/get.
+_annot_lock = threading.Lock()
+
+def _annotations_state(path: Path) -> tuple:
     if not path.exists():
-        return []
+        return (None, [], {})
+    mtime = path.stat().st_mtime_ns
+    cached = _annot_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached
+    # One bulk read + C-level line split; the per-line work is orjson only.
     items = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                items.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return items
+    for line in path.read_bytes().splitlines():
+        if not line:
+            continue
+        try:
+            items.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    by_id = {it["text_id"]: i for i, it in enumerate(items) if "text_id" in it}
+    state = (mtime, items, by_id)
+    _annot_cache[path] = state
+    return state
+
+def read_annotations_jsonl(path: Path) -> List[Dict[str, Any]]:
+    return _annotations_state(path)[1]
+
+# mtime-keyed raw-bytes cache for small JSON files that are served verbatim
+# (e.g. classes.json): no per-request read, parse or re-serialization.
+_bytes_cache: Dict[Path, tuple] = {}
+
+def read_bytes_cached(path: Path) -> bytes:
+    if not path.exists():
+        raise HTTPException(500, f"Missing file: {path}")
+    mtime = path.stat().st_mtime_ns
+    cached = _bytes_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, path.read_bytes())
+        _bytes_cache[path] = cached
+    return cached[1]
+
+def annotations_index(path: Path) -> Dict[str, int]:
+    """text_id -> index into read_annotations_jsonl(path)."""
+    return _annotations_state(path)[2]
+
+def annotations_state(path: Path) -> tuple:
+    """(items, by_id) from one cache snapshot. Use this when both are needed
+    so an interleaved write cannot split the lookup across two generations."""
+    _, items, by_id = _annotations_state(path)
+    return items, by_id
 
 def write_annotations_jsonl(path: Path, items: List[Dict[str, Any]]):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
-        for obj in items:
-            tmp.write(json.dumps(obj, ensure_ascii=False) + "\n")
-        tmp_path = tmp.name
-    os.replace(tmp_path, path)
+    with _annot_lock:
+        with tempfile.NamedTemporaryFile("wb", delete=False) as tmp:
+            # Serialize everything up front and issue one write instead of one
+            # concatenation + write per record.
+            if items:
+                tmp.write(b"\n".join(orjson.dumps(obj) for obj in items) + b"\n")
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp_path = tmp.name
+        os.replace(tmp_path, path)
+        # fsync the directory so the rename itself survives a crash
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        # Prime the cache with what we just wrote instead of re-parsing on next read.
+        by_id = {it["text_id"]: i for i, it in enumerate(items) if "text_id" in it}
+        _annot_cache[path] = (path.stat().st_mtime_ns, list(items), by_id)
+
+def append_annotation(path: Path, obj: Dict[str, Any]):
+    """Append a single record in O(1); use for text_ids not already in the file.
+    Overwrites of existing records still go through write_annotations_jsonl."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _annot_lock:
+        _, items, by_id = _annotations_state(path)
+        with path.open("ab") as f:
+            f.write(orjson.dumps(obj) + b"\n")
+        items = list(items) + [obj]
+        by_id = dict(by_id)
+        if "text_id" in obj:
+            by_id[obj["text_id"]] = len(items) - 1
+        _annot_cache[path] = (path.stat().st_mtime_ns, items, by_id)
 
 def write_json_atomic(path: Path, obj: dict):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
-        json.dump(obj, tmp, ensure_ascii=False, indent=2)
+    with tempfile.NamedTemporaryFile("wb", delete=False) as tmp:
+        tmp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
         tmp_path = tmp.name
     os.replace(tmp_path, path)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import json, os, re, textwrap, importlib, tempfile
-from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -12,6 +11,45 @@ from app.services.enums import list_enums_from_module, append_new_enums, load_fi
 from app.services.io import write_json_atomic
 from app.models.schemas import AttrSpec, ProposedClassIn, ProposedRelationIn
 
+# Precompiled name validators (shared by class and relation proposals)
+_SNAKE_FIELD_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+_CAMEL_NAME_RE = re.compile(r"^[A-Z][A-Za-z0-9_]*$")
+
+# CamelCase -> CONST_CASE boundaries (camel_to_const_name)
+_CAMEL_BOUNDARY1_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY2_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+# Declared-name extractors for the two proposed files
+_CLASS_DEF_NAME_RE = re.compile(r"^\s*class\s+([A-Za-z0-9_]+)\s*\(", re.M)
+_REL_NAME_DECL_RE = re.compile(r'name="([A-Za-z0-9_]+)"')
+
+# Name sets per proposed file, keyed by mtime: the duplicate check is a hash
+# lookup instead of a full-file read + regex scan per POST.
+_declared_cache: Dict[Path, tuple] = {}  # path -> (mtime_ns, set[str])
+
+def _declared_names(path: Path, pattern: re.Pattern) -> set:
+    if not path.exists():
+        return set()
+    mtime = path.stat().st_mtime_ns
+    cached = _declared_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    names = set(pattern.findall(path.read_text(encoding="utf-8")))
+    _declared_cache[path] = (mtime, names)
+    return names
+
+def _note_declared(path: Path, name: str):
+    """Record a just-appended name so the next check skips the rescan."""
+    cached = _declared_cache.get(path)
+    names = cached[1] if cached is not None else set()
+    names.add(name)
+    _declared_cache[path] = (path.stat().st_mtime_ns, names)
+
+def _dedup_preserve(seq) -> list:
+    """Order-preserving dedup in one pass over a (possibly lazy) iterable."""
+    seen = set()
+    return [x for x in seq if not (x in seen or seen.add(x))]
+
 # ---- Proposed classes ----
 
 def ensure_proposed_classes_file():
@@ -70,7 +108,7 @@ def render_class_code(payload: ProposedClassIn) -> str:
         lines.append('    """No description provided."""')
 
     for a in payload.attributes:
-        if not re.match(r"^[a-z_][a-z0-9_]*$", a.name):
+        if not _SNAKE_FIELD_RE.match(a.name):
             raise HTTPException(400, f'Invalid field name: "{a.name}" (use snake_case).')
         ann, default = render_type_and_default(a)
         desc_json = json.dumps(a.description or "")
@@ -79,15 +117,15 @@ def render_class_code(payload: ProposedClassIn) -> str:
     return "\n".join(lines) + "\n"
 
 def propose_class(payload: ProposedClassIn):
-    if not re.match(r"^[A-Z][A-Za-z0-9_]*$", payload.name):
+    if not _CAMEL_NAME_RE.match(payload.name):
         raise HTTPException(400, "Invalid Python class name (use CamelCase).")
     ensure_proposed_classes_file()
-    txt = PROPOSED_FILE.read_text(encoding="utf-8")
-    if re.search(rf"^\s*class\s+{re.escape(payload.name)}\s*\(", txt, flags=re.M):
+    if payload.name in _declared_names(PROPOSED_FILE, _CLASS_DEF_NAME_RE):
         raise HTTPException(409, f'Class "{payload.name}" already exists in proposed_classes.py')
     code = "\n" + render_class_code(payload)
     with PROPOSED_FILE.open("a", encoding="utf-8") as f:
         f.write(code)
+    _note_declared(PROPOSED_FILE, payload.name)
     return {"ok": True, "file": str(PROPOSED_FILE), "bytes_written": len(code)}
 
 # ---- Proposed relations ----
@@ -107,9 +145,8 @@ def ensure_proposed_rel_file():
     PROPOSED_REL_FILE.write_text(header + "\n\n", encoding="utf-8")
 
 def camel_to_const_name(s: str) -> str:
-    import re as _re
-    s1 = _re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", s)
-    s2 = _re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1)
+    s1 = _CAMEL_BOUNDARY1_RE.sub(r"\1_\2", s)
+    s2 = _CAMEL_BOUNDARY2_RE.sub(r"\1_\2", s1)
     return s2.upper()
 
 def sanitize_py_str(s: str) -> str:
@@ -170,7 +207,7 @@ def render_relationship_code(*,
     return "\n" + "\n".join(parts)
 
 def propose_relation(payload: ProposedRelationIn, known_classes: set[str]):
-    if not re.match(r"^[A-Z][A-Za-z0-9_]*$", payload.name):
+    if not _CAMEL_NAME_RE.match(payload.name):
         raise HTTPException(400, "Invalid relation name (use CamelCase, e.g., ChemicalAffectsGene)")
 
     if not payload.subject_classes or not all(c in known_classes for c in payload.subject_classes):
@@ -196,7 +233,7 @@ def propose_relation(payload: ProposedRelationIn, known_classes: set[str]):
         return candidate
 
     for f in payload.fields:
-        if not re.match(r"^[a-z_][a-z0-9_]*$", f.name):
+        if not _SNAKE_FIELD_RE.match(f.name):
             raise HTTPException(400, f"Invalid field name '{f.name}' (use snake_case)")
 
         item: dict = {"name": f.name, "kind": f.kind, "optional": bool(f.optional)}
@@ -219,7 +256,7 @@ def propose_relation(payload: ProposedRelationIn, known_classes: set[str]):
         elif f.kind == "dynamic":
             if not f.classes:
                 raise HTTPException(400, f"Field '{f.name}' is dynamic but has no classes")
-            item["classes"] = list(dict.fromkeys([str(c) for c in f.classes]))
+            item["classes"] = _dedup_preserve(map(str, f.classes))
 
         elif f.kind == "free_text":
             item["text_type"] = f.text_type or "text"
@@ -234,8 +271,7 @@ def propose_relation(payload: ProposedRelationIn, known_classes: set[str]):
         upsert_relation_specific_field_descriptions(payload.name, rel_specific_added)
 
     ensure_proposed_rel_file()
-    existing = PROPOSED_REL_FILE.read_text(encoding="utf-8") if PROPOSED_REL_FILE.exists() else ""
-    if f"name=\"{payload.name}\"" in existing:
+    if payload.name in _declared_names(PROPOSED_REL_FILE, _REL_NAME_DECL_RE):
         raise HTTPException(409, f"A proposed relation named '{payload.name}' already exists in proposed_rel.py")
 
     code = render_relationship_code(
@@ -248,6 +284,7 @@ def propose_relation(payload: ProposedRelationIn, known_classes: set[str]):
     )
     with PROPOSED_REL_FILE.open("a", encoding="utf-8") as f:
         f.write(code)
+    _note_declared(PROPOSED_REL_FILE, payload.name)
 
     return {
         "ok": True,
@@ -81,6 +81,76 @@ def build_relations_meta() -> Dict[str, Any] | None:
         out[spec.name] = relation_spec_to_meta(spec)
     return out
 
+def _make_attr_validator(name: str, aspec: Dict[str, Any]):
+    """Build one closure per predicate attribute that validates and normalizes
+    a single value. The kind dispatch and enum/classes set construction happen
+    here, once, so the per-relation loop is a plain function call."""
+    kind = aspec.get("kind", "text")
+
+    if kind == "enum":
+        allowed = frozenset(aspec.get("enum", []) or [])
+        allowed_sorted = sorted(allowed)
+        def _v(val, ent_map, rel_id):
+            if val not in allowed:
+                raise HTTPException(
+                    400,
+                    f"Relation {rel_id}: invalid value '{val}' for '{name}'. Allowed: {allowed_sorted}"
+                )
+            return val
+
+    elif kind == "number":
+        def _v(val, ent_map, rel_id):
+            try:
+                return float(val)
+            except Exception:
+                raise HTTPException(400, f"Relation {rel_id}: '{name}' must be numeric")
+
+    elif kind == "entity":
+        classes = frozenset(aspec.get("classes", []) or [])
+        classes_list = list(aspec.get("classes", []) or [])
+        def _v(val, ent_map, rel_id):
+            target = ent_map.get(str(val))
+            if (not target) or (target.class_ not in classes):
+                raise HTTPException(
+                    400,
+                    f"Relation {rel_id}: attribute '{name}' must reference an entity with class in {classes_list}"
+                )
+            return target.id
+
+    else:
+        def _v(val, ent_map, rel_id):
+            return str(val)
+
+    return _v
+
+# Compiled form of the most recent meta dict. build_relations_meta() is
+# lru_cache'd, so an identity check on the source dict is enough to reuse
+# the compiled validators across requests.
+_compiled_cache: tuple[Any, Dict[str, Any]] | None = None
+
+def _compile_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn the per-predicate subject/object lists into frozensets and each
+    attribute spec into a prebuilt validator closure, instead of rebuilding
+    sets and dispatching on `kind` per relation below."""
+    global _compiled_cache
+    if _compiled_cache is not None and _compiled_cache[0] is meta:
+        return _compiled_cache[1]
+    compiled = {}
+    for pred, spec in meta.items():
+        attrs = {}
+        for name, aspec in (spec.get("attributes", {}) or {}).items():
+            attrs[name] = {
+                "nullable": bool(aspec.get("nullable", True)),
+                "validate": _make_attr_validator(name, aspec),
+            }
+        compiled[pred] = {
+            "subject": frozenset(spec.get("subject", []) or []),
+            "object": frozenset(spec.get("object", []) or []),
+            "attrs": attrs,
+        }
+    _compiled_cache = (meta, compiled)
+    return compiled
+
 def validate_and_normalize_relations(payload: SavePayload) -> list[dict]:
     """
     Returns a cleaned list of relation dicts ready to persist.
@@ -91,29 +161,31 @@ def validate_and_normalize_relations(payload: SavePayload) -> list[dict]:
     meta = build_relations_meta() or load_json(RELATIONS_FILE)
     if not meta:
         raise HTTPException(500, "No relation metadata available.")
+    compiled = _compile_meta(meta)
 
     ent_map = {e.id: e for e in payload.entities}
     cleaned = []
 
     for rel in payload.relations:
-        if rel.predicate not in meta:
+        spec = compiled.get(rel.predicate)
+        if spec is None:
             raise HTTPException(400, f"Unknown relation type '{rel.predicate}' in relation {rel.id}")
 
         if rel.subject not in ent_map or rel.object not in ent_map:
             raise HTTPException(400, f"Relation {rel.id} refers to unknown entity id(s).")
 
-        spec = meta[rel.predicate]
         subj = ent_map[rel.subject]
         obj  = ent_map[rel.object]
+        subj_id, obj_id = rel.subject, rel.object
 
-        subj_ok = subj.class_ in set(spec.get("subject", []))
-        obj_ok  = obj.class_  in set(spec.get("object",  []))
+        subj_ok = subj.class_ in spec["subject"]
+        obj_ok  = obj.class_  in spec["object"]
 
         if not (subj_ok and obj_ok):
-            subj_ok_rev = subj.class_ in set(spec.get("object", []))
-            obj_ok_rev  = obj.class_  in set(spec.get("subject", []))
+            subj_ok_rev = subj.class_ in spec["object"]
+            obj_ok_rev  = obj.class_  in spec["subject"]
             if subj_ok_rev and obj_ok_rev:
-                rel.subject, rel.object = rel.object, rel.subject
+                subj_id, obj_id = obj_id, subj_id
                 subj, obj = obj, subj
             else:
                 raise HTTPException(
@@ -121,7 +193,7 @@ def validate_and_normalize_relations(payload: SavePayload) -> list[dict]:
                     f"Relation {rel.id} pair ({subj.class_} → {obj.class_}) not allowed for '{rel.predicate}'"
                 )
 
-        want_attrs = spec.get("attributes", {}) or {}
+        want_attrs = spec["attrs"]
         keep: dict[str, any] = {} # type: ignore
         given = rel.attributes or {}
 
@@ -130,8 +202,7 @@ def validate_and_normalize_relations(payload: SavePayload) -> list[dict]:
             if not aspec:
                 continue
 
-            nullable = bool(aspec.get("nullable", True))
-            kind = aspec.get("kind", "text")
+            nullable = aspec["nullable"]
             val = given.get(name, None)
 
             if (val is None or val == "") and not nullable:
@@ -141,42 +212,17 @@ def validate_and_normalize_relations(payload: SavePayload) -> list[dict]:
                 keep[name] = None
                 continue
 
-            if kind == "enum":
-                allowed = set(aspec.get("enum", []))
-                if val not in allowed:
-                    raise HTTPException(
-                        400,
-                        f"Relation {rel.id}: invalid value '{val}' for '{name}'. Allowed: {sorted(allowed)}"
-                    )
-                keep[name] = val
-
-            elif kind == "number":
-                try:
-                    keep[name] = float(val)
-                except Exception:
-                    raise HTTPException(400, f"Relation {rel.id}: '{name}' must be numeric")
-
-            elif kind == "entity":
-                target = ent_map.get(str(val))
-                if (not target) or (target.class_ not in set(aspec.get("classes", []))):
-                    raise HTTPException(
-                        400,
-                        f"Relation {rel.id}: attribute '{name}' must reference an entity with class in {aspec.get('classes')}"
-                    )
-                keep[name] = target.id
-
-            else:
-                keep[name] = str(val)
+            keep[name] = aspec["validate"](val, ent_map, rel.id)
 
         for name, aspec in want_attrs.items():
-            if not aspec.get("nullable", True) and name not in keep:
+            if not aspec["nullable"] and name not in keep:
                 raise HTTPException(400, f"Relation {rel.id}: missing required attribute '{name}'")
 
         cleaned.append({
             "id": rel.id,
             "predicate": rel.predicate,
-            "subject": rel.subject,
-            "object": rel.object,
+            "subject": subj_id,
+            "object": obj_id,
             "attributes": keep
         })
 
@@ -36,7 +36,8 @@ def main():
     emb = emb.astype("float32")
 
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    np.savez(args.out, labels=np.array(names, dtype=object), embeddings=emb)
+    # str dtype (not object) so the server can load with allow_pickle=False
+    np.savez(args.out, labels=np.array(names, dtype=str), embeddings=emb)
 
     Path(args.meta_out).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"Wrote {args.out} with {len(names)} classes.")
@@ -33,7 +33,8 @@ def main():
     embs = model.encode(texts, normalize_embeddings=True, show_progress_bar=True)
     embs = embs.astype("float32")
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    np.savez(args.out, labels=np.array(labels, dtype=object), embeddings=embs)
+    # str dtype (not object) so the server can load with allow_pickle=False
+    np.savez(args.out, labels=np.array(labels, dtype=str), embeddings=embs)
 
     Path(args.meta_out).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"Wrote {args.out} and {args.meta_out}.")